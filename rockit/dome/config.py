@@ -19,7 +19,15 @@
 # pylint: disable=too-many-instance-attributes
 
 import json
-from rockit.common import daemons, IP, validation
+from operator import itemgetter
+
+# Sub-schemas that are shared between multiple properties
+_STRING = {'type': 'string'}
+_BOOLEAN = {'type': 'boolean'}
+_NON_NEGATIVE_INTEGER = {'type': 'integer', 'minimum': 0}
+_NON_NEGATIVE_NUMBER = {'type': 'number', 'minimum': 0}
+_DAEMON_NAME = {'type': 'string', 'daemon_name': True}
+_SIDE_STRINGS = {'a': _STRING, 'b': _STRING}
 
 CONFIG_SCHEMA = {
     'type': 'object',
@@ -30,13 +38,8 @@ CONFIG_SCHEMA = {
         'heartbeat_port', 'heartbeat_baud', 'heartbeat_timeout', 'sides', 'side_labels', 'invert_on_close'
     ],
     'properties': {
-        'daemon': {
-            'type': 'string',
-            'daemon_name': True
-        },
-        'log_name': {
-            'type': 'string'
-        },
+        'daemon': _DAEMON_NAME,
+        'log_name': _STRING,
         'control_machines': {
             'type': 'array',
             'items': {
@@ -44,93 +47,49 @@ CONFIG_SCHEMA = {
                 'machine_name': True
             }
         },
-        'serial_port': {
-            'type': 'string'
-        },
-        'serial_baud': {
-            'type': 'integer',
-            'minimum': 0
-        },
-        'serial_timeout': {
-            'type': 'number',
-            'minimum': 0
-        },
-        'command_delay': {
-            'type': 'number',
-            'minimum': 0
-        },
-        'step_command_delay': {
-            'type': 'number',
-            'minimum': 0
-        },
-        'shutter_timeout': {
-            'type': 'number',
-            'minimum': 0
-        },
-        'has_legacy_controller': {
-            'type': 'boolean'
-        },
-        'has_bumper_guard': {
-            'type': 'boolean'
-        },
-        'slow_open_steps': {
-            'type': 'integer',
-            'minimum': 0
-        },
-        'heartbeat_port': {
-            'type': 'string'
-        },
-        'heartbeat_baud': {
-            'type': 'integer',
-            'minimum': 0
-        },
-        'heartbeat_timeout': {
-            'type': 'number',
-            'minimum': 0
-        },
+        'serial_port': _STRING,
+        'serial_baud': _NON_NEGATIVE_INTEGER,
+        'serial_timeout': _NON_NEGATIVE_NUMBER,
+        'command_delay': _NON_NEGATIVE_NUMBER,
+        'step_command_delay': _NON_NEGATIVE_NUMBER,
+        'shutter_timeout': _NON_NEGATIVE_NUMBER,
+        'has_legacy_controller': _BOOLEAN,
+        'has_bumper_guard': _BOOLEAN,
+        'slow_open_steps': _NON_NEGATIVE_INTEGER,
+        'heartbeat_port': _STRING,
+        'heartbeat_baud': _NON_NEGATIVE_INTEGER,
+        'heartbeat_timeout': _NON_NEGATIVE_NUMBER,
         'sides': {
             'type': 'object',
-            'additionalProperties': {
-                'type': 'string'
-            }
+            'additionalProperties': _STRING
         },
         'side_labels': {
             'type': 'object',
             'required': ['a', 'b'],
-            'properties': {
-                'a': {
-                    'type': 'string'
-                },
-                'b': {
-                    'type': 'string'
-                }
-            }
-        },
-        'invert_on_close': {
-            'type': 'boolean'
-        },
-        'domealert_daemon': {
-            'type': 'string',
-            'daemon_name': True
+            'properties': _SIDE_STRINGS
         },
+        'invert_on_close': _BOOLEAN,
+        'domealert_daemon': _DAEMON_NAME,
         'domealert_belt_sensors': {
             'type': 'object',
-            'properties': {
-                'a': {
-                    'type': 'string'
-                },
-                'b': {
-                    'type': 'string'
-                }
-            }
+            'properties': _SIDE_STRINGS
         }
     }
 }
 
+# Config keys that are copied directly into Config attributes
+_get_config_values = itemgetter(
+    'log_name', 'serial_port', 'serial_baud', 'serial_timeout', 'command_delay', 'step_command_delay',
+    'shutter_timeout', 'has_legacy_controller', 'heartbeat_port', 'heartbeat_baud', 'heartbeat_timeout',
+    'slow_open_steps', 'has_bumper_guard', 'sides', 'side_labels', 'invert_on_close')
+
 
 class Config:
     """Daemon configuration parsed from a json file"""
     def __init__(self, config_filename):
+        # Deferred so that clients that only need the status constants don't pay for importing rockit.common
+        from rockit.common import daemons, IP, validation  # pylint: disable=import-outside-toplevel
+
         # Will throw on file not found or invalid json
         with open(config_filename, 'r', encoding='utf-8') as config_file:
             config_json = json.load(config_file)
@@ -142,23 +101,12 @@ class Config:
         })
 
         self.daemon = getattr(daemons, config_json['daemon'])
-        self.log_name = config_json['log_name']
         self.control_ips = [getattr(IP, machine) for machine in config_json['control_machines']]
-        self.serial_port = config_json['serial_port']
-        self.serial_baud = config_json['serial_baud']
-        self.serial_timeout_seconds = config_json['serial_timeout']
-        self.command_delay_seconds = config_json['command_delay']
-        self.step_command_delay_seconds = config_json['step_command_delay']
-        self.shutter_timeout_seconds = config_json['shutter_timeout']
-        self.legacy_controller = config_json['has_legacy_controller']
-        self.heartbeat_port = config_json['heartbeat_port']
-        self.heartbeat_baud = config_json['heartbeat_baud']
-        self.heartbeat_timeout_seconds = config_json['heartbeat_timeout']
-        self.slow_open_steps = config_json['slow_open_steps']
-        self.has_bumper_guard = config_json['has_bumper_guard']
-        self.sides = config_json['sides']
-        self.side_labels = config_json['side_labels']
-        self.invert_on_close = config_json['invert_on_close']
+        (self.log_name, self.serial_port, self.serial_baud, self.serial_timeout_seconds,
+         self.command_delay_seconds, self.step_command_delay_seconds, self.shutter_timeout_seconds,
+         self.legacy_controller, self.heartbeat_port, self.heartbeat_baud, self.heartbeat_timeout_seconds,
+         self.slow_open_steps, self.has_bumper_guard, self.sides, self.side_labels,
+         self.invert_on_close) = _get_config_values(config_json)
 
         self.domealert_daemon = None
         self.domealert_belt_sensors = {
@@ -166,8 +114,10 @@ class Config:
             'b': None
         }
 
-        if 'domealert_daemon' in config_json:
-            self.domealert_daemon = getattr(daemons, config_json['domealert_daemon'])
-            if 'domealert_belt_sensors' in config_json:
+        domealert_daemon = config_json.get('domealert_daemon')
+        if domealert_daemon:
+            self.domealert_daemon = getattr(daemons, domealert_daemon)
+            belt_sensors = config_json.get('domealert_belt_sensors')
+            if belt_sensors:
                 for side in ['a', 'b']:
-                    self.domealert_belt_sensors[side] = config_json['domealert_belt_sensors'].get(side, None)
+                    self.domealert_belt_sensors[side] = belt_sensors.get(side, None)
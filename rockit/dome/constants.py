@@ -16,6 +16,16 @@
 
 """Constants and status codes used by domed"""
 
+import functools
+from enum import IntEnum
+
+_UNKNOWN_FORMATTED = '[b][red]UNKNOWN[/red][/b]'
+
+
+@functools.lru_cache(maxsize=64)
+def _unknown_message(error_code):
+    return f'error: Unknown error code {error_code}'
+
 
 class CommandStatus:
     """Numeric return codes"""
@@ -52,32 +62,20 @@ class CommandStatus:
     @classmethod
     def message(cls, error_code):
         """Returns a human readable string describing an error code"""
-        if error_code in cls._messages:
-            return cls._messages[error_code]
-        return f'error: Unknown error code {error_code}'
-
+        message = cls._messages.get(error_code)
+        if message is None:
+            return _unknown_message(error_code)
+        return message
 
-class DomeShutterStatus:
-    """Status of the dome shutters"""
-    Closed, Open, PartiallyOpen, Opening, Closing, HeartbeatMonitorForceClosing = range(6)
-
-    _labels = {
-        0: 'CLOSED',
-        1: 'OPEN',
-        2: 'PARTIALLY OPEN',
-        3: 'OPENING',
-        4: 'CLOSING',
-        5: 'FORCE CLOSING',
-    }
 
-    _colors = {
-        0: 'red',
-        1: 'green',
-        2: 'cyan',
-        3: 'yellow',
-        4: 'yellow',
-        5: 'red'
-    }
+class _LabelledStatus(IntEnum):
+    """Base for status codes that carry a human readable label and terminal color"""
+    def __new__(cls, value, label, color):
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.plain_label = label
+        member.formatted_label = f'[b][{color}]{label}[/{color}][/b]'
+        return member
 
     @classmethod
     def label(cls, status, formatting=False):
@@ -85,47 +83,26 @@ class DomeShutterStatus:
         Returns a human readable string describing a status
         Set formatting=true to enable terminal formatting characters
         """
-        if formatting:
-            if status in cls._labels and status in cls._colors:
-                return f'[b][{cls._colors[status]}]{cls._labels[status]}[/{cls._colors[status]}][/b]'
-            return '[b][red]UNKNOWN[/red][/b]'
+        member = cls._value2member_map_.get(status)
+        if member is None:
+            return _UNKNOWN_FORMATTED if formatting else 'UNKNOWN'
+        return member.formatted_label if formatting else member.plain_label
 
-        if status in cls._labels:
-            return cls._labels[status]
-        return 'UNKNOWN'
 
+class DomeShutterStatus(_LabelledStatus):
+    """Status of the dome shutters"""
+    Closed = 0, 'CLOSED', 'red'
+    Open = 1, 'OPEN', 'green'
+    PartiallyOpen = 2, 'PARTIALLY OPEN', 'cyan'
+    Opening = 3, 'OPENING', 'yellow'
+    Closing = 4, 'CLOSING', 'yellow'
+    HeartbeatMonitorForceClosing = 5, 'FORCE CLOSING', 'red'
 
-class DomeHeartbeatStatus:
-    """Status of the dome heartbeat monitoring"""
-    Disabled, Active, TrippedClosing, TrippedIdle, Unavailable = range(5)
-
-    _labels = {
-        0: 'DISABLED',
-        1: 'ACTIVE',
-        2: 'CLOSING DOME',
-        3: 'TRIPPED',
-        4: 'UNAVAILABLE',
-    }
-
-    _colors = {
-        0: 'default',
-        1: 'green',
-        2: 'red',
-        3: 'red',
-        4: 'yellow',
-    }
 
-    @classmethod
-    def label(cls, status, formatting=False):
-        """
-        Returns a human readable string describing a status
-        Set formatting=true to enable terminal formatting characters
-        """
-        if formatting:
-            if status in cls._labels and status in cls._colors:
-                return f'[b][{cls._colors[status]}]{cls._labels[status]}[/{cls._colors[status]}][/b]'
-            return '[b][red]UNKNOWN[/red][/b]'
-
-        if status in cls._labels:
-            return cls._labels[status]
-        return 'UNKNOWN'
+class DomeHeartbeatStatus(_LabelledStatus):
+    """Status of the dome heartbeat monitoring"""
+    Disabled = 0, 'DISABLED', 'default'
+    Active = 1, 'ACTIVE', 'green'
+    TrippedClosing = 2, 'CLOSING DOME', 'red'
+    TrippedIdle = 3, 'TRIPPED', 'red'
+    Unavailable = 4, 'UNAVAILABLE', 'yellow'